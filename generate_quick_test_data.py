@@ -8,10 +8,10 @@ without waiting for full ML model training.
 
 import os
 import sys
-import json
-import random
+import numpy as np
+import orjson
 import time
-import uuid
+from collections import defaultdict
 from datetime import datetime, timedelta
 import csv
 import argparse
@@ -24,16 +24,98 @@ TEST_STORES_PATH = os.path.join(OUTPUT_DIR, 'test_stores.json')
 TEST_CUSTOMERS_PATH = os.path.join(OUTPUT_DIR, 'test_customers.json')
 TEST_ORDERS_PATH = os.path.join(OUTPUT_DIR, 'test_orders.json')
 TEST_CLUSTERS_PATH = os.path.join(OUTPUT_DIR, 'test_clusters.json')
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, so streamed records reach disk in few write calls
+
+# Choices for categorical fields
+EMAIL_DOMAINS = ('gmail.com', 'yahoo.com', 'outlook.com', 'company.com')
+AGENT_STATUSES = ("Active", "Inactive", "On Leave")
+VEHICLE_TYPES = ("Car", "Van", "Motorcycle", "Truck")
+AVAILABILITIES = ("Full-time", "Part-time", "Weekends Only")
+STORE_TYPES = ("Warehouse", "Retail Store", "Distribution Center", "Fulfillment Center")
+STREETS = ('Main', 'Oak', 'Pine', 'Maple', 'Cedar')
+CUSTOMER_TYPES = ("Residential", "Business", "Government", "Educational")
+PRIORITY_LEVELS = ("Standard", "High", "Premium")
+ORDER_PRIORITIES = ("Low", "Medium", "High", "Urgent")
+PHONE_POOL_SIZE = 2048
 
 # Create output directory
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def load_city_sample(limit=1000):
+class _JsonArrayWriter:
+    """
+    Stream records to a file as a JSON array, one record at a time
+    
+    Records go to a temporary file that only replaces path once the array has
+    been completed, so a failed run never leaves a partial file behind.
+    """
+    
+    def __init__(self, path, pretty=False):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.file = None
+        self.count = 0
+        # Compact output by default; pretty matches json.dump(..., indent=2)
+        self.pretty = pretty
+        self.option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        self.opening = b'\n  ' if pretty else b''
+        self.separator = b',\n  ' if pretty else b','
+        self.closing = b'\n' if pretty else b''
+    
+    def __enter__(self):
+        self.file = open(self.tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self.file.write(b'[')
+        return self
+    
+    def write(self, record):
+        data = orjson.dumps(record, option=self.option)
+        if self.pretty:
+            # Nest the record one level inside the array
+            data = data.replace(b'\n', b'\n  ')
+        self.file.write(self.separator if self.count else self.opening)
+        self.file.write(data)
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.file.close()
+            os.remove(self.tmp_path)
+            return False
+        self.file.write(self.closing + b']' if self.count else b']')
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        return False
+
+def _dump(path, records, pretty=False):
+    """Write a list of records to path as a JSON array"""
+    with _JsonArrayWriter(path, pretty) as writer:
+        for record in records:
+            writer.write(record)
+
+def _date_cache(now, min_days_ago, max_days_ago):
+    """Map each day offset in [min_days_ago, max_days_ago] to its date string relative to now"""
+    return {
+        days: (now - timedelta(days=days)).strftime("%Y-%m-%d")
+        for days in range(min_days_ago, max_days_ago + 1)
+    }
+
+def _bulk_uuids(count, rng):
+    """Generate count random version-4 UUID strings from a single byte draw"""
+    raw = np.frombuffer(rng.bytes(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # Version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    hexed = raw.tobytes().hex()
+    return [
+        f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+        for h in (hexed[i * 32:(i + 1) * 32] for i in range(count))
+    ]
+
+def load_city_sample(limit=1000, rng=None):
     """
     Load a sample of cities from the CSV file
     
     Args:
         limit: Maximum number of cities to load
+        rng: numpy.random.Generator used for fallback city locations
         
     Returns:
         List of city dictionaries
@@ -69,6 +151,10 @@ def load_city_sample(limit=1000):
         print(f"Error loading cities data: {e}")
         # Generate some random cities as fallback
         print("Generating random city locations instead")
+        if rng is None:
+            rng = np.random.default_rng()
+        latitudes = rng.uniform(-90, 90, limit).tolist()
+        longitudes = rng.uniform(-180, 180, limit).tolist()
         cities = []
         for i in range(limit):
             cities.append({
@@ -76,204 +162,251 @@ def load_city_sample(limit=1000):
                 'name': f'City {i}',
                 'country': 'Test Country',
                 'state': 'Test State',
-                'latitude': random.uniform(-90, 90),
-                'longitude': random.uniform(-180, 180)
+                'latitude': latitudes[i],
+                'longitude': longitudes[i]
             })
         return cities
 
-def generate_phone_number():
-    """Generate a realistic phone number"""
-    area_code = random.randint(200, 999)
-    exchange = random.randint(200, 999)
-    number = random.randint(1000, 9999)
-    return f"+1 ({area_code}) {exchange}-{number}"
-
-def generate_email(name):
-    """Generate an email based on name"""
-    name = name.lower().replace(' ', '.')
-    domains = ['gmail.com', 'yahoo.com', 'outlook.com', 'company.com']
-    return f"{name}@{random.choice(domains)}"
+def generate_phone_numbers(count, rng=None):
+    """Draw count phone numbers from a pool of up to PHONE_POOL_SIZE realistic numbers"""
+    if rng is None:
+        rng = np.random.default_rng()
+    pool_size = min(count, PHONE_POOL_SIZE)
+    area_codes = rng.integers(200, 1000, pool_size).tolist()
+    exchanges = rng.integers(200, 1000, pool_size).tolist()
+    numbers = rng.integers(1000, 10000, pool_size).tolist()
+    pool = [
+        f"+1 ({area_code}) {exchange}-{number}"
+        for area_code, exchange, number in zip(area_codes, exchanges, numbers)
+    ]
+    if count <= PHONE_POOL_SIZE:
+        return pool
+    return [pool[i] for i in rng.integers(0, pool_size, count).tolist()]
 
-def generate_field_agents(num_agents=50, cities=None):
+def generate_field_agents(num_agents=50, cities=None, rng=None, pretty=False):
     """Generate test field agents"""
     print(f"Generating {num_agents} field agents")
     
     if not cities:
         cities = []
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    join_dates = _date_cache(datetime.now(), 30, 1000)
+    
+    # Draw all random fields up front
+    random_lats = rng.uniform(-80, 80, num_agents).tolist()
+    random_lons = rng.uniform(-170, 170, num_agents).tolist()
+    status_idx = rng.integers(0, len(AGENT_STATUSES), num_agents).tolist()
+    license_numbers = rng.integers(100000, 1000000, num_agents).tolist()
+    vehicle_idx = rng.integers(0, len(VEHICLE_TYPES), num_agents).tolist()
+    max_capacities = rng.integers(5, 51, num_agents).tolist()
+    availability_idx = rng.integers(0, len(AVAILABILITIES), num_agents).tolist()
+    ratings = np.round(rng.uniform(3.0, 5.0, num_agents), 1).tolist()
+    join_days = rng.integers(30, 1001, num_agents).tolist()
+    domain_idx = rng.integers(0, len(EMAIL_DOMAINS), num_agents).tolist()
+    phones = generate_phone_numbers(num_agents, rng)
     
     # Use cities for agent locations, or generate random locations
     agents = []
-    for i in range(1, num_agents + 1):
-        first_name = f"Agent{i}"
-        last_name = f"Field{i}"
-        full_name = f"{first_name} {last_name}"
-        
-        # Get city or random location
-        if cities and i <= len(cities):
-            city = cities[i - 1]
-            location = {
-                'latitude': city['latitude'],
-                'longitude': city['longitude'],
-                'city': city['name']
-            }
-        else:
-            location = {
-                'latitude': random.uniform(-80, 80),
-                'longitude': random.uniform(-170, 170),
-                'city': f"City {i}"
+    with _JsonArrayWriter(TEST_AGENTS_PATH, pretty) as writer:
+        for idx in range(num_agents):
+            i = idx + 1
+            full_name = f"Agent{i} Field{i}"
+            
+            # Get city or random location
+            if cities and i <= len(cities):
+                city = cities[i - 1]
+                location = {
+                    'latitude': city['latitude'],
+                    'longitude': city['longitude'],
+                    'city': city['name']
+                }
+            else:
+                location = {
+                    'latitude': random_lats[idx],
+                    'longitude': random_lons[idx],
+                    'city': f"City {i}"
+                }
+            
+            agent = {
+                "id": i,
+                "username": f"agent{i}",
+                "password": "password123",  # In a real system, would be hashed
+                "email": f"agent{i}.field{i}@{EMAIL_DOMAINS[domain_idx[idx]]}",
+                "phone": phones[idx],
+                "fullName": full_name,
+                "role": "driver",
+                "status": AGENT_STATUSES[status_idx[idx]],
+                "homeBase": location['city'],
+                "latitude": location['latitude'],
+                "longitude": location['longitude'],
+                "licenseNumber": f"DL{license_numbers[idx]}",
+                "vehicleType": VEHICLE_TYPES[vehicle_idx[idx]],
+                "maxCapacity": max_capacities[idx],
+                "availability": AVAILABILITIES[availability_idx[idx]],
+                "rating": ratings[idx],
+                "joinDate": join_dates[join_days[idx]]
             }
-        
-        agent = {
-            "id": i,
-            "username": f"agent{i}",
-            "password": "password123",  # In a real system, would be hashed
-            "email": generate_email(full_name),
-            "phone": generate_phone_number(),
-            "fullName": full_name,
-            "role": "driver",
-            "status": random.choice(["Active", "Inactive", "On Leave"]),
-            "homeBase": location['city'],
-            "latitude": location['latitude'],
-            "longitude": location['longitude'],
-            "licenseNumber": f"DL{random.randint(100000, 999999)}",
-            "vehicleType": random.choice(["Car", "Van", "Motorcycle", "Truck"]),
-            "maxCapacity": random.randint(5, 50),
-            "availability": random.choice(["Full-time", "Part-time", "Weekends Only"]),
-            "rating": round(random.uniform(3.0, 5.0), 1),
-            "joinDate": (datetime.now() - timedelta(days=random.randint(30, 1000))).strftime("%Y-%m-%d")
-        }
-        agents.append(agent)
-    
-    # Save to file
-    with open(TEST_AGENTS_PATH, 'w') as f:
-        json.dump(agents, f, indent=2)
+            agents.append(agent)
+            writer.write(agent)
     
     print(f"Saved {len(agents)} agents to {TEST_AGENTS_PATH}")
     return agents
 
-def generate_stores(num_stores=100, cities=None):
+def generate_stores(num_stores=100, cities=None, rng=None, pretty=False):
     """Generate test stores/warehouses"""
     print(f"Generating {num_stores} stores/warehouses")
     
     if not cities:
         cities = []
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Draw all random fields up front
+    random_lats = rng.uniform(-80, 80, num_stores).tolist()
+    random_lons = rng.uniform(-170, 170, num_stores).tolist()
+    type_idx = rng.integers(0, len(STORE_TYPES), num_stores).tolist()
+    street_numbers = rng.integers(100, 10000, num_stores).tolist()
+    capacities = rng.integers(1000, 10001, num_stores).tolist()
+    is_active = (rng.random(num_stores) > 0.1).tolist()  # 90% are active
+    phones = generate_phone_numbers(num_stores, rng)
     
     # Use cities for store locations, or generate random locations
     stores = []
-    for i in range(1, num_stores + 1):
-        # Get city or random location
-        if cities and i <= len(cities):
-            city = cities[i - 1]
-            location = {
-                'latitude': city['latitude'],
-                'longitude': city['longitude'],
-                'city': city['name'],
-                'state': city['state'],
-                'country': city['country']
-            }
-        else:
-            location = {
-                'latitude': random.uniform(-80, 80),
-                'longitude': random.uniform(-170, 170),
-                'city': f"City {i}",
-                'state': 'State',
-                'country': 'Country'
+    with _JsonArrayWriter(TEST_STORES_PATH, pretty) as writer:
+        for idx in range(num_stores):
+            i = idx + 1
+            # Get city or random location
+            if cities and i <= len(cities):
+                city = cities[i - 1]
+                location = {
+                    'latitude': city['latitude'],
+                    'longitude': city['longitude'],
+                    'city': city['name'],
+                    'state': city['state'],
+                    'country': city['country']
+                }
+            else:
+                location = {
+                    'latitude': random_lats[idx],
+                    'longitude': random_lons[idx],
+                    'city': f"City {i}",
+                    'state': 'State',
+                    'country': 'Country'
+                }
+            
+            store_name = f"Store {location['city']} #{i}"
+            
+            store = {
+                "id": i,
+                "name": store_name,
+                "type": STORE_TYPES[type_idx[idx]],
+                "address": f"{street_numbers[idx]} Main St, {location['city']}, {location['state']}",
+                "city": location['city'],
+                "country": location['country'],
+                "latitude": location['latitude'],
+                "longitude": location['longitude'],
+                "capacity": capacities[idx],
+                "manager": f"Manager {i}",
+                "contact": phones[idx],
+                "email": f"store{i}@company.com",
+                "operatingHours": "8:00 AM - 6:00 PM",
+                "isActive": is_active[idx]
             }
-        
-        store_name = f"Store {location['city']} #{i}"
-        
-        store = {
-            "id": i,
-            "name": store_name,
-            "type": random.choice(["Warehouse", "Retail Store", "Distribution Center", "Fulfillment Center"]),
-            "address": f"{random.randint(100, 9999)} Main St, {location['city']}, {location['state']}",
-            "city": location['city'],
-            "country": location['country'],
-            "latitude": location['latitude'],
-            "longitude": location['longitude'],
-            "capacity": random.randint(1000, 10000),
-            "manager": f"Manager {i}",
-            "contact": generate_phone_number(),
-            "email": f"store{i}@company.com",
-            "operatingHours": "8:00 AM - 6:00 PM",
-            "isActive": random.random() > 0.1  # 90% are active
-        }
-        stores.append(store)
-    
-    # Save to file
-    with open(TEST_STORES_PATH, 'w') as f:
-        json.dump(stores, f, indent=2)
+            stores.append(store)
+            writer.write(store)
     
     print(f"Saved {len(stores)} stores to {TEST_STORES_PATH}")
     return stores
 
-def generate_customers(num_customers=2000, cities=None):
+def generate_customers(num_customers=2000, cities=None, rng=None, pretty=False):
     """Generate test customers"""
     print(f"Generating {num_customers} customers")
     
     if not cities:
         cities = []
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    customer_since_dates = _date_cache(datetime.now(), 1, 700)
+    
+    # Draw all random fields up front
+    lat_offsets = rng.uniform(-0.02, 0.02, num_customers).tolist()
+    lon_offsets = rng.uniform(-0.02, 0.02, num_customers).tolist()
+    random_lats = rng.uniform(-80, 80, num_customers).tolist()
+    random_lons = rng.uniform(-170, 170, num_customers).tolist()
+    street_numbers = rng.integers(100, 10000, num_customers).tolist()
+    street_idx = rng.integers(0, len(STREETS), num_customers).tolist()
+    since_days = rng.integers(1, 701, num_customers).tolist()
+    type_idx = rng.integers(0, len(CUSTOMER_TYPES), num_customers).tolist()
+    priority_idx = rng.integers(0, len(PRIORITY_LEVELS), num_customers).tolist()
+    domain_idx = rng.integers(0, len(EMAIL_DOMAINS), num_customers).tolist()
+    phones = generate_phone_numbers(num_customers, rng)
     
     # Use cities for customer locations, or generate random locations
     customers = []
-    for i in range(1, num_customers + 1):
-        first_name = f"Customer{i}"
-        last_name = f"User{i}"
-        full_name = f"{first_name} {last_name}"
-        
-        # Get city or random location with some randomness added
-        if cities:
-            city_idx = i % len(cities)  # Cycle through cities for large customer counts
-            city = cities[city_idx]
+    with _JsonArrayWriter(TEST_CUSTOMERS_PATH, pretty) as writer:
+        for idx in range(num_customers):
+            i = idx + 1
+            full_name = f"Customer{i} User{i}"
             
-            # Add some randomness to the exact location (within the city)
-            lat_offset = random.uniform(-0.02, 0.02)
-            lon_offset = random.uniform(-0.02, 0.02)
+            # Get city or random location with some randomness added
+            if cities:
+                city_idx = i % len(cities)  # Cycle through cities for large customer counts
+                city = cities[city_idx]
+                
+                # Add some randomness to the exact location (within the city)
+                location = {
+                    'latitude': city['latitude'] + lat_offsets[idx],
+                    'longitude': city['longitude'] + lon_offsets[idx],
+                    'city': city['name'],
+                    'country': city['country']
+                }
+            else:
+                location = {
+                    'latitude': random_lats[idx],
+                    'longitude': random_lons[idx],
+                    'city': f"City {i % 100 + 1}",  # Cycle through 100 city names
+                    'country': 'Country'
+                }
+            city_name = location['city']
             
-            location = {
-                'latitude': city['latitude'] + lat_offset,
-                'longitude': city['longitude'] + lon_offset,
-                'city': city['name'],
-                'country': city['country']
-            }
-        else:
-            location = {
-                'latitude': random.uniform(-80, 80),
-                'longitude': random.uniform(-170, 170),
-                'city': f"City {i % 100 + 1}",  # Cycle through 100 city names
-                'country': 'Country'
+            customer = {
+                "id": i,
+                "name": full_name,
+                "email": f"customer{i}.user{i}@{EMAIL_DOMAINS[domain_idx[idx]]}",
+                "phone": phones[idx],
+                "address": f"{street_numbers[idx]} {STREETS[street_idx[idx]]} St, {city_name}",
+                "city": city_name,
+                "country": location['country'],
+                "latitude": location['latitude'],
+                "longitude": location['longitude'],
+                "customerSince": customer_since_dates[since_days[idx]],
+                "type": CUSTOMER_TYPES[type_idx[idx]],
+                "priorityLevel": PRIORITY_LEVELS[priority_idx[idx]]
             }
-        
-        customer = {
-            "id": i,
-            "name": full_name,
-            "email": generate_email(full_name),
-            "phone": generate_phone_number(),
-            "address": f"{random.randint(100, 9999)} {random.choice(['Main', 'Oak', 'Pine', 'Maple', 'Cedar'])} St, {location['city']}",
-            "city": location['city'],
-            "country": location['country'],
-            "latitude": location['latitude'],
-            "longitude": location['longitude'],
-            "customerSince": (datetime.now() - timedelta(days=random.randint(1, 700))).strftime("%Y-%m-%d"),
-            "type": random.choice(["Residential", "Business", "Government", "Educational"]),
-            "priorityLevel": random.choice(["Standard", "High", "Premium"])
-        }
-        customers.append(customer)
-    
-    # Save to file
-    with open(TEST_CUSTOMERS_PATH, 'w') as f:
-        json.dump(customers, f, indent=2)
+            customers.append(customer)
+            writer.write(customer)
     
     print(f"Saved {len(customers)} customers to {TEST_CUSTOMERS_PATH}")
     return customers
 
-def generate_orders(num_orders=5000, customers=None, stores=None):
-    """Generate test orders/leads"""
+def generate_orders(num_orders=5000, customers=None, stores=None, rng=None):
+    """
+    Generate test orders/leads
+    
+    Returns:
+        Tuple of (list of order dictionaries, dict of per-order coordinate arrays
+        keyed by 'pickup_lat', 'pickup_lon', 'delivery_lat' and 'delivery_lon')
+    """
     print(f"Generating {num_orders} orders/leads")
     
     if not customers or not stores:
         print("Need customers and stores to generate orders")
-        return []
+        return [], {}
+    if rng is None:
+        rng = np.random.default_rng()
     
     # Order statuses with weightings
     status_weights = {
@@ -287,44 +420,59 @@ def generate_orders(num_orders=5000, customers=None, stores=None):
         "OnHold": 0.05
     }
     statuses = list(status_weights.keys())
-    weights = list(status_weights.values())
+    # Normalize once so the weights need not sum exactly to 1
+    weights = np.array(list(status_weights.values()), dtype=np.float64)
+    weights /= weights.sum()
+    
+    # Expected delivery can be up to 14 days in the future
+    date_strs = _date_cache(datetime.now(), -14, 60)
+    
+    # Draw all random fields up front
+    customer_choice = rng.integers(0, len(customers), num_orders)
+    store_choice = rng.integers(0, len(stores), num_orders)
+    customer_idx = customer_choice.tolist()
+    store_idx = store_choice.tolist()
+    order_days = rng.integers(1, 61, num_orders).tolist()
+    delivery_offsets = rng.integers(1, 16, num_orders).tolist()
+    status_idx = rng.choice(len(statuses), num_orders, p=weights).tolist()
+    priority_idx = rng.integers(0, len(ORDER_PRIORITIES), num_orders).tolist()
+    items = rng.integers(1, 11, num_orders).tolist()
+    total_weights = np.round(rng.uniform(0.5, 50.0, num_orders), 2).tolist()
+    values = np.round(rng.uniform(10.0, 500.0, num_orders), 2).tolist()
+    tracking_uuids = _bulk_uuids(num_orders, rng)
     
     # Generate orders
     orders = []
-    for i in range(1, num_orders + 1):
+    for idx in range(num_orders):
+        i = idx + 1
         # Select random customer and store
-        customer = random.choice(customers)
-        store = random.choice(stores)
+        customer = customers[customer_idx[idx]]
+        store = stores[store_idx[idx]]
         
         # Generate order date (between 1 and 60 days ago)
-        order_date = datetime.now() - timedelta(days=random.randint(1, 60))
-        order_date_str = order_date.strftime("%Y-%m-%d")
+        order_date_str = date_strs[order_days[idx]]
         
         # Generate expected delivery date (between order date and 15 days later)
-        delivery_date = order_date + timedelta(days=random.randint(1, 15))
-        delivery_date_str = delivery_date.strftime("%Y-%m-%d")
+        delivery_date_str = date_strs[order_days[idx] - delivery_offsets[idx]]
         
         # Generate a unique ID for tracking
-        tracking_uuid = str(uuid.uuid4())
+        tracking_uuid = tracking_uuids[idx]
         
         # Generate a QR code URL (simulated)
         qr_code_url = f"https://api.qrserver.com/v1/create-qr-code/?size=200x200&data={tracking_uuid}"
         
-        # Select a random status based on weights
-        status = random.choices(statuses, weights=weights)[0]
-        
         order = {
             "id": i,
             "uuid": tracking_uuid,
             "customerId": customer["id"],
             "storeId": store["id"],
-            "status": status,
-            "priority": random.choice(["Low", "Medium", "High", "Urgent"]),
+            "status": statuses[status_idx[idx]],
+            "priority": ORDER_PRIORITIES[priority_idx[idx]],
             "orderDate": order_date_str,
             "expectedDeliveryDate": delivery_date_str,
-            "items": random.randint(1, 10),
-            "totalWeight": round(random.uniform(0.5, 50.0), 2),
-            "value": round(random.uniform(10.0, 500.0), 2),
+            "items": items[idx],
+            "totalWeight": total_weights[idx],
+            "value": values[idx],
             "currency": "USD",
             "qrCode": qr_code_url,
             "notes": f"Test order {i}",
@@ -337,48 +485,74 @@ def generate_orders(num_orders=5000, customers=None, stores=None):
         }
         orders.append(order)
     
+    # Column-wise copy of the order coordinates for array-based processing
+    customer_lats = np.array([customer["latitude"] for customer in customers], dtype=np.float64)
+    customer_lons = np.array([customer["longitude"] for customer in customers], dtype=np.float64)
+    store_lats = np.array([store["latitude"] for store in stores], dtype=np.float64)
+    store_lons = np.array([store["longitude"] for store in stores], dtype=np.float64)
+    arrays = {
+        'pickup_lat': store_lats[store_choice],
+        'pickup_lon': store_lons[store_choice],
+        'delivery_lat': customer_lats[customer_choice],
+        'delivery_lon': customer_lons[customer_choice]
+    }
+    
     print(f"Generated {len(orders)} orders")
-    return orders
+    return orders, arrays
 
-def create_simple_clusters(orders, num_clusters=20):
-    """Create simple clusters for orders based on proximity"""
+def create_simple_clusters(orders, arrays, num_clusters=20, rng=None, pretty=False):
+    """
+    Create simple clusters for orders based on proximity
+    
+    Args:
+        orders: List of order dictionaries, updated with their clusterId
+        arrays: Per-order coordinate arrays from generate_orders; a 'cluster_id'
+            array is added
+        num_clusters: Number of clusters to create
+        rng: numpy.random.Generator used for cluster radii
+    """
     print(f"Creating {num_clusters} clusters from {len(orders)} orders")
     
     # Simple approach: divide the orders into regions based on coordinates
-    min_lat = min(order["deliveryLatitude"] for order in orders)
-    max_lat = max(order["deliveryLatitude"] for order in orders)
-    min_lon = min(order["deliveryLongitude"] for order in orders)
-    max_lon = max(order["deliveryLongitude"] for order in orders)
+    lats = arrays['delivery_lat']
+    lons = arrays['delivery_lon']
+    min_lat, max_lat = lats.min(), lats.max()
+    min_lon, max_lon = lons.min(), lons.max()
     
     # Create latitude and longitude ranges
+    side = int(num_clusters ** 0.5)
     lat_step = (max_lat - min_lat) / (num_clusters ** 0.5)
     lon_step = (max_lon - min_lon) / (num_clusters ** 0.5)
     
     # Assign cluster IDs to orders
-    for order in orders:
-        lat_bin = int((order["deliveryLatitude"] - min_lat) / lat_step)
-        lon_bin = int((order["deliveryLongitude"] - min_lon) / lon_step)
-        cluster_id = lat_bin * int(num_clusters ** 0.5) + lon_bin + 1
-        order["clusterId"] = min(cluster_id, num_clusters)  # Cap at num_clusters
-    
-    # Create cluster definitions
-    clusters = {}
-    for order in orders:
-        cluster_id = order["clusterId"]
-        if cluster_id not in clusters:
-            clusters[cluster_id] = {
-                "lat_sum": 0,
-                "lon_sum": 0,
-                "count": 0
-            }
-        
-        clusters[cluster_id]["lat_sum"] += order["deliveryLatitude"]
-        clusters[cluster_id]["lon_sum"] += order["deliveryLongitude"]
-        clusters[cluster_id]["count"] += 1
+    lat_bin = ((lats - min_lat) / lat_step).astype(np.int32)
+    lon_bin = ((lons - min_lon) / lon_step).astype(np.int32)
+    cluster_ids = np.minimum(lat_bin * side + lon_bin + 1, num_clusters)  # Cap at num_clusters
+    arrays['cluster_id'] = cluster_ids
+    for order, cluster_id in zip(orders, cluster_ids.tolist()):
+        order["clusterId"] = cluster_id
+    
+    # Accumulate cluster centroids
+    lat_sums = np.bincount(cluster_ids, weights=lats, minlength=num_clusters + 1)
+    lon_sums = np.bincount(cluster_ids, weights=lons, minlength=num_clusters + 1)
+    counts = np.bincount(cluster_ids, minlength=num_clusters + 1)
+    clusters = {
+        int(cluster_id): {
+            "lat_sum": float(lat_sums[cluster_id]),
+            "lon_sum": float(lon_sums[cluster_id]),
+            "count": int(counts[cluster_id])
+        }
+        for cluster_id in np.flatnonzero(counts)
+    }
+    
+    if rng is None:
+        rng = np.random.default_rng()
     
     # Convert clusters to proper format
+    today = datetime.now().strftime("%Y-%m-%d")
+    radii = rng.uniform(2.0, 10.0, len(clusters)).tolist()
     cluster_defs = []
-    for cluster_id, data in clusters.items():
+    for (cluster_id, data), radius in zip(clusters.items(), radii):
         count = data["count"]
         if count > 0:
             cluster_def = {
@@ -386,10 +560,10 @@ def create_simple_clusters(orders, num_clusters=20):
                 "name": f"Cluster {cluster_id}",
                 "latitude": data["lat_sum"] / count,
                 "longitude": data["lon_sum"] / count,
-                "radius": random.uniform(2.0, 10.0),
+                "radius": radius,
                 "orderCount": count,
-                "createdAt": datetime.now().strftime("%Y-%m-%d"),
-                "lastUpdated": datetime.now().strftime("%Y-%m-%d"),
+                "createdAt": today,
+                "lastUpdated": today,
                 "status": "Active",
                 "description": f"Automatically generated cluster with {count} orders"
             }
@@ -398,36 +572,33 @@ def create_simple_clusters(orders, num_clusters=20):
     print(f"Created {len(cluster_defs)} cluster definitions")
     
     # Save orders and clusters
-    with open(TEST_ORDERS_PATH, 'w') as f:
-        json.dump(orders, f, indent=2)
-    
-    with open(TEST_CLUSTERS_PATH, 'w') as f:
-        json.dump(cluster_defs, f, indent=2)
+    _dump(TEST_ORDERS_PATH, orders, pretty)
+    _dump(TEST_CLUSTERS_PATH, cluster_defs, pretty)
     
     return orders, cluster_defs
 
-def assign_drivers_to_orders(orders, agents, num_assigned_percentage=0.6):
+def assign_drivers_to_orders(orders, agents, num_assigned_percentage=0.6, rng=None, pretty=False):
     """Assign drivers to a percentage of orders"""
     print(f"Assigning drivers to {num_assigned_percentage*100:.0f}% of orders")
     
+    if rng is None:
+        rng = np.random.default_rng()
+    
     # Calculate number of orders to assign
     num_to_assign = int(len(orders) * num_assigned_percentage)
     
-    # Select random orders to assign
-    orders_to_assign = random.sample(orders, num_to_assign)
+    # Select random orders to assign by index, without copying the order list
+    order_idx = rng.choice(len(orders), num_to_assign, replace=False).tolist()
     
     # For each cluster, try to assign the same driver to all orders in that cluster
-    clusters = {}
-    for order in orders_to_assign:
-        cluster_id = order["clusterId"]
-        if cluster_id not in clusters:
-            clusters[cluster_id] = []
-        clusters[cluster_id].append(order)
+    clusters = defaultdict(list)
+    for i in order_idx:
+        clusters[orders[i]["clusterId"]].append(orders[i])
     
     # Assign drivers to clusters
     for cluster_id, cluster_orders in clusters.items():
         # Randomly select a driver
-        driver = random.choice(agents)
+        driver = agents[rng.integers(0, len(agents))]
         
         # Assign to all orders in this cluster
         for order in cluster_orders:
@@ -440,8 +611,7 @@ def assign_drivers_to_orders(orders, agents, num_assigned_percentage=0.6):
     print(f"Assigned drivers to {num_to_assign} orders")
     
     # Save updated orders
-    with open(TEST_ORDERS_PATH, 'w') as f:
-        json.dump(orders, f, indent=2)
+    _dump(TEST_ORDERS_PATH, orders, pretty)
     
     return orders
 
@@ -451,22 +621,26 @@ def generate_all_test_data(options):
     
     print(f"Generating test data with {options.num_orders} orders")
     
+    # All randomness comes from this generator, so a given --seed reproduces the same data
+    rng = np.random.default_rng(options.seed)
+    
     # 1. Load city data
-    cities = load_city_sample(limit=options.city_limit)
+    cities = load_city_sample(limit=options.city_limit, rng=rng)
     
-    # 2. Generate agents, stores, and customers
-    agents = generate_field_agents(options.num_agents, cities)
-    stores = generate_stores(options.num_stores, cities)
-    customers = generate_customers(options.num_customers, cities)
+    # 2. Generate agents, stores, and customers, each with its own RNG stream
+    agent_rng, store_rng, customer_rng = rng.spawn(3)
+    agents = generate_field_agents(options.num_agents, cities, agent_rng, options.pretty)
+    stores = generate_stores(options.num_stores, cities, store_rng, options.pretty)
+    customers = generate_customers(options.num_customers, cities, customer_rng, options.pretty)
     
     # 3. Generate orders
-    orders = generate_orders(options.num_orders, customers, stores)
+    orders, order_arrays = generate_orders(options.num_orders, customers, stores, rng)
     
     # 4. Create clusters for orders
-    orders, clusters = create_simple_clusters(orders, options.num_clusters)
+    orders, clusters = create_simple_clusters(orders, order_arrays, options.num_clusters, rng, options.pretty)
     
     # 5. Assign drivers to orders
-    orders = assign_drivers_to_orders(orders, agents, options.driver_assignment_percentage)
+    orders = assign_drivers_to_orders(orders, agents, options.driver_assignment_percentage, rng, options.pretty)
     
     elapsed_time = time.time() - start_time
     print(f"\nTest data generation completed in {elapsed_time:.2f} seconds!")
@@ -482,6 +656,8 @@ def main():
     parser.add_argument('--num-clusters', type=int, default=20, help='Number of clusters to create')
     parser.add_argument('--city-limit', type=int, default=1000, help='Maximum number of cities to load from CSV')
     parser.add_argument('--driver-assignment-percentage', type=float, default=0.6, help='Percentage of orders to assign drivers to')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible test data')
+    parser.add_argument('--pretty', action='store_true', help='Write indented JSON (same layout as json.dump with indent=2) instead of compact JSON')
     
     options = parser.parse_args()
     
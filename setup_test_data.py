@@ -14,9 +14,12 @@ Usage:
 import os
 import sys
 import argparse
-import subprocess
+import contextlib
+import io
+import runpy
 import time
-import json
+import traceback
+import orjson
 
 # Constants
 MODELS_DIR = 'server/models'
@@ -28,20 +31,47 @@ def ensure_directory(path):
         os.makedirs(path, exist_ok=True)
         print(f"Created directory: {path}")
 
-def run_command(command, description):
-    """Run a shell command and return the result"""
+def run_script(script_path, args, description):
+    """Run a Python script in this process and return whether it succeeded"""
     print(f"\n{description}...")
-    print(f"Command: {' '.join(command)}")
+    print(f"Script: {' '.join([script_path] + args)}")
     
     start_time = time.time()
-    result = subprocess.run(command, capture_output=True, text=True)
+    saved_argv, saved_path = sys.argv, sys.path[:]
+    saved_modules = set(sys.modules)
+    sys.argv = [script_path] + args
+    # Match `python script.py`, which puts the script's directory first on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script_path)))
+    # Capture the script's output, as running it as a subprocess did
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+        # Drop modules the script imported so they don't leak into the next stage
+        for name in set(sys.modules) - saved_modules:
+            del sys.modules[name]
     elapsed_time = time.time() - start_time
     
-    print(f"Finished in {elapsed_time:.2f} seconds with exit code {result.returncode}")
+    print(f"Finished in {elapsed_time:.2f} seconds with exit code {exit_code}")
     
-    if result.returncode != 0:
+    if exit_code != 0:
         print("ERROR:")
-        print(result.stderr)
+        print(stderr.getvalue())
         return False
     
     return True
@@ -60,8 +90,8 @@ def train_models():
         return True
     
     # Train models using geomodels.py
-    return run_command(
-        ["python", "server/geomodels.py"],
+    return run_script(
+        "server/geomodels.py", [],
         "Training machine learning models"
     )
 
@@ -70,9 +100,8 @@ def generate_test_data(options):
     # Create test data directory if needed
     ensure_directory(TEST_DATA_DIR)
     
-    # Build command with options
-    command = [
-        "python", "server/generate_test_data.py",
+    # Build arguments with options
+    args = [
         "--num-agents", str(options.num_agents),
         "--num-stores", str(options.num_stores),
         "--num-customers", str(options.num_customers),
@@ -80,8 +109,8 @@ def generate_test_data(options):
         "--num-clusters", str(options.num_clusters)
     ]
     
-    return run_command(
-        command,
+    return run_script(
+        "server/generate_test_data.py", args,
         f"Generating test data with {options.num_orders} orders"
     )
 
@@ -89,29 +118,24 @@ def import_test_data(options):
     """Import test data using the specified method"""
     if options.import_method == "api":
         # Import through API
-        command = [
-            "python", "server/import_test_data.py",
-            "--batch-size", str(options.batch_size)
-        ]
+        args = ["--batch-size", str(options.batch_size)]
         
         if options.max_orders > 0:
-            command.extend(["--max-orders", str(options.max_orders)])
+            args.extend(["--max-orders", str(options.max_orders)])
         
-        return run_command(
-            command,
+        return run_script(
+            "server/import_test_data.py", args,
             f"Importing test data through API"
         )
     else:
         # Direct import to storage
-        command = [
-            "python", "server/direct_import.py"
-        ]
+        args = []
         
         if options.max_orders > 0:
-            command.extend(["--max-orders", str(options.max_orders)])
+            args.extend(["--max-orders", str(options.max_orders)])
         
-        return run_command(
-            command,
+        return run_script(
+            "server/direct_import.py", args,
             f"Directly importing test data to storage"
         )
 
@@ -170,23 +194,23 @@ def main():
     print("\nData Summary:")
     try:
         if os.path.exists(os.path.join(TEST_DATA_DIR, 'test_agents.json')):
-            with open(os.path.join(TEST_DATA_DIR, 'test_agents.json'), 'r') as f:
-                agent_count = len(json.load(f))
+            with open(os.path.join(TEST_DATA_DIR, 'test_agents.json'), 'rb') as f:
+                agent_count = len(orjson.loads(f.read()))
                 print(f"- Field Agents: {agent_count}")
         
         if os.path.exists(os.path.join(TEST_DATA_DIR, 'test_stores.json')):
-            with open(os.path.join(TEST_DATA_DIR, 'test_stores.json'), 'r') as f:
-                store_count = len(json.load(f))
+            with open(os.path.join(TEST_DATA_DIR, 'test_stores.json'), 'rb') as f:
+                store_count = len(orjson.loads(f.read()))
                 print(f"- Stores: {store_count}")
         
         if os.path.exists(os.path.join(TEST_DATA_DIR, 'test_customers.json')):
-            with open(os.path.join(TEST_DATA_DIR, 'test_customers.json'), 'r') as f:
-                customer_count = len(json.load(f))
+            with open(os.path.join(TEST_DATA_DIR, 'test_customers.json'), 'rb') as f:
+                customer_count = len(orjson.loads(f.read()))
                 print(f"- Customers: {customer_count}")
         
         if os.path.exists(os.path.join(TEST_DATA_DIR, 'test_orders.json')):
-            with open(os.path.join(TEST_DATA_DIR, 'test_orders.json'), 'r') as f:
-                orders = json.load(f)
+            with open(os.path.join(TEST_DATA_DIR, 'test_orders.json'), 'rb') as f:
+                orders = orjson.loads(f.read())
                 print(f"- Orders: {len(orders)}")
                 
                 # Count orders by status
@@ -200,8 +224,8 @@ def main():
                     print(f"  - {status}: {count} ({count/len(orders)*100:.1f}%)")
         
         if os.path.exists(os.path.join(TEST_DATA_DIR, 'test_clusters.json')):
-            with open(os.path.join(TEST_DATA_DIR, 'test_clusters.json'), 'r') as f:
-                cluster_count = len(json.load(f))
+            with open(os.path.join(TEST_DATA_DIR, 'test_clusters.json'), 'rb') as f:
+                cluster_count = len(orjson.loads(f.read()))
                 print(f"- Clusters: {cluster_count}")
         
     except Exception as e: